@@ -8,21 +8,12 @@ parser = ArgumentParser()
 parser.add_argument("file")
 
 
-PAT = re.compile("(frictionless).+")
-NL = "\n"
-
-
-def _filter(row):
-    match = PAT.match(row)
-    if match:
-        return match.group(1)
-    else:
-        return row
+PAT = re.compile(r"^(frictionless).+$", re.MULTILINE)
 
 
 if __name__ == "__main__":
     opts = parser.parse_args()
     req = Path(opts.file)
     tmp = req.with_suffix(".tmp")
-    tmp.write_text(NL.join([_filter(line) for line in req.read_text().split(NL)]))
+    tmp.write_text(PAT.sub(r"\1", req.read_text()))
     tmp.replace(req)
@@ -10,22 +10,12 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
-# import os
-import sys
-from unittest.mock import MagicMock
+# NOTE: the API documentation for `friendly_data` is generated with
+# `sphinx-autoapi`, which parses the source instead of importing it.  So the
+# package, and its heavy dependencies (`pandas`, `xarray`, etc) need not be
+# installed (or mocked) to build the docs.
 import sphinx_rtd_theme  # noqa: F401
 
-
-class MyMock(MagicMock):
-    def __repr__(self):
-        parent = self._mock_parent
-        return f"{parent}.{self._mock_name}" if parent else self._mock_name
-
-
-sys.path.insert(0, "../")
-mocked_modules = ["glom", "glom.matching", "pandas", "pyam", "xarray"]
-sys.modules.update((mod, MyMock(name=mod)) for mod in mocked_modules)
-
 # -- Project information -----------------------------------------------------
 
 project = "friendly_data"
@@ -42,8 +32,8 @@ release = "0.2.2.dev"
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
 extensions = [
-    "sphinx.ext.autodoc",
-    "sphinx.ext.autosummary",
+    "autoapi.extension",
+    "sphinx.ext.autodoc",  # for the external API docs, and autoapi directives
     "sphinx.ext.mathjax",
     "sphinx.ext.viewcode",
     "sphinx.ext.extlinks",
@@ -52,8 +42,11 @@ extensions = [
     "sphinx_rtd_theme",
 ]
 
-autodoc_default_options = {"members": None}
-autosummary_generate = True
+autodoc_default_options = {"members": True}
+
+autoapi_type = "python"
+autoapi_dirs = ["../friendly_data"]
+autoapi_generate_api_docs = False  # API docs are organised in api/api.rst
 
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ["_templates"]
@@ -79,7 +72,6 @@ html_theme_options = {
 # relative to this directory. They are copied after the builtin static files,
 # so a file named "default.css" will overwrite the builtin "default.css".
 html_static_path = ["_static"]
-html_css_files = ["css/custom.css"]
 
 # -- Options for LaTeX output ------------------------------------------------
 latex_engine = "xelatex"
@@ -101,3 +93,10 @@ latex_documents = [
     #     "manual",
     # ),
 ]
+
+
+def setup(app):
+    # NOTE: registering the stylesheet here instead of with `html_css_files`
+    # keeps the config stable between runs; otherwise Sphinx sees a changed
+    # option on every build, and discards the cached (pickled) environment
+    app.add_css_file("css/custom.css")
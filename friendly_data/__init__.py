@@ -1,13 +1,17 @@
-def logger_config(lvl: int = 0, fmt: str = ""):
-    from logging import Formatter, getLogger, StreamHandler, WARNING
+from logging import Formatter, getLogger, StreamHandler, WARNING
+
 
+def logger_config(lvl: int = 0, fmt: str = ""):
     lvl = WARNING if lvl == 0 else lvl
     fmt = fmt if fmt else "{asctime}:{levelname}:{name}:{lineno}: {message}"
 
     logger = getLogger(__name__)
-    formatter = Formatter(fmt, style="{", datefmt="%Y-%m-%dT%H:%M")
-    logstream = StreamHandler()
-    logstream.setFormatter(formatter)
-    logger.addHandler(logstream)
+    # NOTE: only attach a handler once, repeat calls (e.g. from different
+    # modules) would otherwise emit every record multiple times
+    if not logger.handlers:
+        formatter = Formatter(fmt, style="{", datefmt="%Y-%m-%dT%H:%M")
+        logstream = StreamHandler()
+        logstream.setFormatter(formatter)
+        logger.addHandler(logstream)
     logger.setLevel(lvl)
     return logger
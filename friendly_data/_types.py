@@ -1,8 +1,9 @@
 from pathlib import Path
-from typing import Dict, TypeVar, Union
+from typing import Dict, TYPE_CHECKING, TypeVar, Union
 
-import pandas as pd
+if TYPE_CHECKING:  # pragma: no cover, avoid importing pandas at runtime
+    import pandas as pd
 
 _path_t = Union[str, Path]  # file path type
 _license_t = Dict[str, str]
-_dfseries_t = TypeVar("_dfseries_t", pd.DataFrame, pd.Series)
+_dfseries_t = TypeVar("_dfseries_t", "pd.DataFrame", "pd.Series")
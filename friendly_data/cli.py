@@ -2,31 +2,26 @@
 
 """
 
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from hashlib import blake2b
 from itertools import chain
+import json
+import os
 from pathlib import Path
 import sys
-from typing import Any, Dict, Iterable, List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
-from frictionless import Package
-from glom import glom, Iter
 
 from friendly_data import logger_config
 from friendly_data._types import _license_t, _path_t
-from friendly_data.converters import to_df
-from friendly_data.dpkg import entry_from_res
-from friendly_data.dpkg import idxpath_from_pkgpath
-from friendly_data.dpkg import pkg_from_files
-from friendly_data.dpkg import pkgindex
-from friendly_data.dpkg import read_pkg
-from friendly_data.dpkg import set_idxcols
-from friendly_data.dpkg import write_pkg
-from friendly_data.helpers import consume, filter_dict
+from friendly_data.helpers import filter_dict
 from friendly_data.helpers import is_windows
 from friendly_data.helpers import sanitise
 from friendly_data.io import copy_files
 from friendly_data.io import dwim_file
-from friendly_data.io import path_not_in
 from friendly_data.io import outoftree_paths
 from friendly_data.metatools import _fetch_license
 from friendly_data.metatools import check_license
@@ -34,10 +29,40 @@ from friendly_data.metatools import get_license
 from friendly_data.metatools import lic_metadata
 from friendly_data.metatools import resolve_licenses
 from friendly_data.registry import config_ctx
-from friendly_data.doc import get_template, page
+
+# NOTE: `frictionless`, `pandas`, & `jinja2` are slow to import, and not every
+# subcommand needs them; so modules that depend on them (`dpkg`, `converters`,
+# `iamc`, and `doc`) are imported inside the functions that use them.
+if TYPE_CHECKING:  # pragma: no cover, only for type checkers
+    from frictionless import Package, Resource
+    from friendly_data.dpkg import pkgindex
 
 logger = logger_config(fmt="{name}: {levelname}: {message}")
 
+# NOTE: every worker profiles a whole dataframe, so peak memory grows with the
+# number of workers; don't default to one worker per CPU
+_MAX_REPORT_WORKERS = 4
+
+
+@lru_cache(maxsize=8)
+def _lic_table(keys: Tuple[str, ...]) -> List[Dict[str, str]]:
+    """License metadata with the requested keys (cached for the session)"""
+    return lic_metadata(keys)
+
+
+def _table(rows: List[Dict[str, str]], keys: Tuple[str, ...]) -> str:
+    """Format rows as a plain text table (like :func:`tabulate.tabulate`)"""
+    if not rows:
+        return ""
+    widths = [max(len(k), *(len(str(r[k])) for r in rows)) for k in keys]
+
+    def _line(cells: Iterable) -> str:
+        return "  ".join(f"{c!s:<{w}}" for c, w in zip(cells, widths)).rstrip()
+
+    lines = [_line(keys), _line("-" * w for w in widths)]
+    lines.extend(_line(r[k] for k in keys) for r in rows)
+    return "\n".join(lines)
+
 
 def list_licenses() -> str:
     """List commonly used licenses
@@ -51,10 +76,8 @@ def list_licenses() -> str:
         ASCII table with commonly used licenses
 
     """
-    from tabulate import tabulate
-
     keys = ("domain", "id", "maintainer", "title")
-    return tabulate(lic_metadata(keys), headers="keys")
+    return _table(_lic_table(keys), keys)
 
 
 def license_info(lic: str) -> Dict:
@@ -72,24 +95,25 @@ def license_info(lic: str) -> Dict:
 
     """
     keys = ("domain", "id", "maintainer", "title", "url")
-    lic_info = lic_metadata(keys, lambda i: i["id"] == lic)
+    lic_info = [i for i in _lic_table(keys) if i["id"] == lic]
     if not lic_info:
         logger.error(f"no matching license with id: {lic}")
         sys.exit(1)
-    return lic_info[0]
+    return dict(lic_info[0])  # copy, don't let callers modify the cache
 
 
 def license_prompt() -> _license_t:  # pragma: no cover, interactive function
     """Prompt for a license on the terminal (with completion)."""
     licenses = _fetch_license("all")
+    ids = sorted(licenses)
 
     def complete(text, state):
-        for lic in licenses:
-            if lic.startswith(text):
-                if not state:
-                    return lic
-                else:
-                    state -= 1
+        # matches are contiguous in the sorted list, starting where the text
+        # would be inserted; readline asks for them one at a time (state)
+        idx = bisect_left(ids, text) + state
+        if idx < len(ids) and ids[idx].startswith(text):
+            return ids[idx]
+        return None
 
     if not is_windows():
         import readline
@@ -121,19 +145,19 @@ def _metadata(
             meta = resolve_licenses(meta)
     else:
         meta = {}
-    _meta: Dict[str, Any] = {
-        "name": name if name else sanitise(title),
-        "title": title,
-        "description": description,
-        "keywords": keywords.split(),
-    }
+    # override config file with values from flags
+    if name or title or description or keywords:  # skip w/o any overrides
+        overrides = (
+            ("name", name if name else sanitise(title)),
+            ("title", title),
+            ("description", description),
+            ("keywords", keywords.split()),
+        )
+        meta.update((k, v) for k, v in overrides if v)
     if licenses:
-        _meta["licenses"] = [get_license(licenses)]
+        meta["licenses"] = [get_license(licenses)]
     elif "licenses" in mandatory and "licenses" not in meta:
-        _meta["licenses"] = [license_prompt()]  # pragma: no cover
-
-    # override config file with values from flags
-    meta.update((k, v) for k, v in _meta.items() if v)
+        meta["licenses"] = [license_prompt()]  # pragma: no cover
 
     check = [k for k in mandatory if k not in meta]  # mandatory fields
     if check:
@@ -157,20 +181,25 @@ def _create(
     *,
     export: _path_t,
 ) -> List[Path]:
+    from friendly_data.dpkg import idxpath_from_pkgpath
+    from friendly_data.dpkg import pkg_from_files
+    from friendly_data.dpkg import pkgindex
+    from friendly_data.dpkg import write_pkg
+
     if export:
         pkgpath, export = Path(pkgpath), Path(export)
         idxp = idxpath_from_pkgpath(pkgpath) if pkgpath.is_dir() else pkgpath
-        spec = Iter("path").map(lambda p: idxp.parent / p)  # type: ignore[union-attr]
-        if idxp:  # create a uniquified list of files
-            files = chain(
-                [idxp],
-                set(chain(glom(pkgindex.from_file(idxp), spec), map(Path, fpaths))),
-            )
+        if idxp:  # create a uniquified list of files, preserving order
+            idxdir = Path(idxp).parent
+            _idxpaths = (idxdir / r["path"] for r in pkgindex.from_file(idxp))
+            _fpaths = (fp if isinstance(fp, Path) else Path(fp) for fp in fpaths)
+            _files = chain(_idxpaths, _fpaths)
+            files = [idxp, *dict.fromkeys(_files)]
         else:
-            files = fpaths  # type: ignore[assignment]
+            files = list(fpaths)
         # NOTE: if idxpath was found, first of the returned files is the index
         # file that was copied in the export directory, extract it to pkgpath
-        fpaths = copy_files(files, export, pkgpath)
+        fpaths = copy_files(files, export, pkgpath, max_workers=min(8, len(files)))
         if idxp:
             pkgpath, *fpaths = fpaths
         else:  # if no index was found, set export directory to new pkgpath
@@ -261,7 +290,7 @@ def create(
 
 def _update(pkg: Dict, pkgpath: _path_t, fpaths: Iterable[_path_t]):
     _fpaths1, outoftree = outoftree_paths(pkgpath, fpaths)
-    _fpaths2 = copy_files(outoftree, pkgpath)
+    _fpaths2 = copy_files(outoftree, pkgpath, max_workers=min(8, len(outoftree)))
     fpaths = _fpaths1 + _fpaths2
     pkg = _rm_from_pkg(pkg, pkgpath, fpaths)
     return _create(pkg, pkgpath, fpaths, export="")
@@ -320,37 +349,73 @@ def update(
         "config": config,
     }
     meta = _metadata([], **meta)  # type: ignore[arg-type]
-    pkg = read_pkg(pkgpath)
-    pkg.update(meta)
 
     if len(fpaths) == 0:
-        files = write_pkg(pkg, pkgpath)
-    else:
-        with config_ctx(conffile=config):
-            files = _update(pkg, pkgpath, fpaths)
+        # NOTE: only the metadata changes, so patch `datapackage.json`
+        # directly; loading the package (and `frictionless`) is unnecessary
+        pkgjson = Path(pkgpath) / "datapackage.json"
+        pkg = dwim_file(pkgjson)
+        pkg.update(meta)  # type: ignore[union-attr]
+        dwim_file(pkgjson, pkg)
+        return f"Package metadata: {pkgjson}"
+
+    from friendly_data.dpkg import read_pkg
+
+    pkg = read_pkg(pkgpath)
+    pkg.update(meta)
+    with config_ctx(conffile=config):
+        files = _update(pkg, pkgpath, fpaths)
     return f"Package metadata: {files[0]}"
 
 
-def _rm_paths_spec(pkgpath: _path_t, fpaths: Iterable[_path_t]):
-    pkgpath = Path(pkgpath)
-    return Iter().filter(lambda r: path_not_in(fpaths, pkgpath / r["path"])).all()
+def _rm_paths_pred(
+    pkgpath: _path_t, fpaths: Iterable[_path_t]
+) -> Callable[[Dict], bool]:
+    """Predicate that is true for resources/index entries that should be kept"""
+    # resolve once, and test membership in a set instead of comparing every
+    # resource against every path with `path_not_in`; resource paths have to
+    # be resolved too, they may be under a symlinked subdirectory
+    root = Path(pkgpath).resolve()
+    fset = frozenset(Path(fp).resolve() for fp in fpaths)
+    return lambda r: (root / r["path"]).resolve() not in fset
 
 
-def _rm_from_pkg(pkg: Dict, pkgpath: _path_t, fpaths: Iterable[_path_t]):
+def _rm_from_pkg(
+    pkg: Dict,
+    pkgpath: _path_t,
+    fpaths: Iterable[_path_t],
+    *,
+    keep: Optional[Callable[[Dict], bool]] = None,
+) -> Dict:
+    if not fpaths:  # nothing to remove
+        return pkg
+    keep = keep if keep else _rm_paths_pred(pkgpath, fpaths)
     count = len(pkg["resources"])
-    pkg["resources"] = glom(pkg["resources"], _rm_paths_spec(pkgpath, fpaths))
+    pkg["resources"] = [r for r in pkg["resources"] if keep(r)]
     if count == len(pkg["resources"]):
         logger.info("no resources to update/remove in package")
     return pkg
 
 
-def _rm_from_idx(pkgpath: _path_t, fpaths: Iterable[_path_t]) -> pkgindex:
+def _rm_from_idx(
+    pkgpath: _path_t,
+    fpaths: Iterable[_path_t],
+    *,
+    keep: Optional[Callable[[Dict], bool]] = None,
+) -> "pkgindex":
+    from friendly_data.dpkg import idxpath_from_pkgpath
+    from friendly_data.dpkg import pkgindex
+
     idx = pkgindex.from_file(idxpath_from_pkgpath(pkgpath))
-    return glom(idx, _rm_paths_spec(pkgpath, fpaths))
+    if not fpaths:  # nothing to remove
+        return idx
+    keep = keep if keep else _rm_paths_pred(pkgpath, fpaths)
+    return pkgindex(entry for entry in idx if keep(entry))
 
 
 def _rm_from_disk(fpaths: Iterable[_path_t]):
-    consume(map(lambda fp: Path(fp).unlink(), fpaths))
+    for fp in fpaths:
+        os.unlink(fp)
 
 
 def remove(pkgpath: str, *fpaths: str, rm_from_disk: bool = False) -> str:
@@ -369,8 +434,12 @@ def remove(pkgpath: str, *fpaths: str, rm_from_disk: bool = False) -> str:
         Permanently delete the files from disk
 
     """
-    pkg = _rm_from_pkg(read_pkg(pkgpath), pkgpath, fpaths)
-    idx = _rm_from_idx(pkgpath, fpaths)
+    from friendly_data.dpkg import read_pkg
+    from friendly_data.dpkg import write_pkg
+
+    keep = _rm_paths_pred(pkgpath, fpaths)  # shared by the package & the index
+    pkg = _rm_from_pkg(read_pkg(pkgpath), pkgpath, fpaths, keep=keep)
+    idx = _rm_from_idx(pkgpath, fpaths, keep=keep)
     fmeta, fidx = write_pkg(pkg, pkgpath, idx=idx)
     if rm_from_disk:
         _rm_from_disk(fpaths)
@@ -384,7 +453,9 @@ def generate_index_file(idxpath: str, *fpaths: str, config: str = ""):
     Parameters
     ----------
     idxpath : str
-        Path where the index file (YAML format) should be written
+        Path where the index file should be written; the format (YAML or
+        JSON) is chosen from the extension.  JSON is faster to read and write
+        for large indexes.
 
     fpaths : Tuple[str]
         List of datasets/resources to include in the index
@@ -394,6 +465,9 @@ def generate_index_file(idxpath: str, *fpaths: str, config: str = ""):
         under a "registry" section.
 
     """
+    from friendly_data.dpkg import entry_from_res
+    from friendly_data.dpkg import set_idxcols
+
     with config_ctx(conffile=config):
         idx = [entry_from_res(set_idxcols(f)) for f in fpaths]
     dwim_file(idxpath, idx)
@@ -425,9 +499,55 @@ def to_iamc(config: str, idxpath: str, iamcpath: str, *, wide: bool = False):
     return f"{', '.join(files)} -> {iamcpath}"
 
 
-def reports(pkg: Package, report_dir: str):
+def _report(res: "Resource", *, title: str, report_dir: Path) -> Dict:
+    """Write an HTML report summarising one resource, return the index entry
+
+    The report is regenerated only if the resource file, its metadata, or the
+    title has changed since the last run; a checksum is saved in a hidden
+    file next to the report (``.<name>.sha``), so that it is not published
+    with the reports.
+
+    """
+    import pandas_profiling as _  # noqa: F401
+
+    from friendly_data.converters import to_df
+    from friendly_data.dpkg import fullpath
+
+    html = Path(res["path"]).with_suffix(".html")
+    entry = {"path": html, "name": res["name"]}
+
+    checksum = blake2b(title.encode(), digest_size=16)
+    checksum.update(json.dumps(res, sort_keys=True, default=str).encode())
+    with open(fullpath(res), mode="rb") as stream:
+        for chunk in iter(partial(stream.read, 1 << 20), b""):
+            checksum.update(chunk)
+    sha = (report_dir / html).with_name(f".{html.stem}.sha")
+    key = checksum.hexdigest()
+    if (report_dir / html).exists() and sha.exists() and sha.read_text() == key:
+        return entry
+
+    df = to_df(res, noexcept=True)
+    fields = res["schema"]["fields"]
+    descr = {f["name"]: f["description"] for f in fields if "description" in f}
+    report = df.profile_report(
+        title=title,
+        dataset=filter_dict(res, ["description"]),  # FIXME: add pkg url
+        variables={"descriptions": descr},
+        html={"minify_html": False},  # set at construction, not after
+    )
+    report.to_file(report_dir / html)
+    sha.write_text(key)
+    return entry
+
+
+def reports(pkg: "Package", report_dir: str):
     """Write HTML reports summarising all resources in the package
 
+    Profiling is CPU heavy, so when there are more than a couple of
+    resources, the reports are generated in parallel over a few processes.
+    Each process holds a whole dataframe in memory, so the number of
+    processes is limited.
+
     Parameters
     ----------
     pkg : Package
@@ -440,36 +560,20 @@ def reports(pkg: Package, report_dir: str):
     int
         Bytes written (index.html)
     """
-    import pandas_profiling as _  # noqa: F401
+    from friendly_data.doc import get_template
 
     _dir = Path(report_dir)
     _dir.mkdir(parents=True, exist_ok=True)
 
     title = pkg.get("title", pkg["name"])
     res = {"title": title, "date": datetime.now().isoformat(), "resources": []}
-    for _res in pkg.resources:
-        df = to_df(_res, noexcept=True)
-        html = Path(_res["path"]).with_suffix(".html")
-        report = df.profile_report(
-            title=title,
-            dataset=filter_dict(_res, ["description"]),  # FIXME: add pkg url
-            variables={
-                "descriptions": glom(
-                    _res,
-                    (
-                        "schema.fields",
-                        Iter()
-                        .filter(lambda i: "description" in i)
-                        .map(lambda i: (i["name"], i["description"]))
-                        .all(),
-                        dict,
-                    ),
-                )
-            },
-        )
-        report.config.html.minify_html = False
-        report.to_file(_dir / html)
-        res["resources"].append({"path": html, "name": _res["name"]})
+    report = partial(_report, title=title, report_dir=_dir)
+    if len(pkg.resources) < 3:  # not worth starting a process pool
+        res["resources"] = list(map(report, pkg.resources))
+    else:
+        nworkers = min(len(pkg.resources), _MAX_REPORT_WORKERS, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=nworkers) as executor:
+            res["resources"] = list(executor.map(report, pkg.resources))
 
     tmpl = get_template("index.html.template")
     return (_dir / "index.html").write_text(tmpl.render(res))
@@ -493,6 +597,9 @@ def describe(pkgpath: str, config: str = "", report_dir: str = ""):
         under a "registry" section.
 
     """
+    from friendly_data.doc import get_template
+    from friendly_data.dpkg import read_pkg
+
     try:
         pkg = read_pkg(pkgpath)
     except (ValueError, FileNotFoundError):
@@ -501,7 +608,7 @@ def describe(pkgpath: str, config: str = "", report_dir: str = ""):
     meta_f = ("name", "title", "description", "keywords", "licenses")
     for k, v in pkg.items():
         if k in meta_f and v:
-            res[k] = glom(v, ["name"]) if k == "licenses" else v
+            res[k] = [lic["name"] for lic in v] if k == "licenses" else v
 
     if report_dir:
         res["report_dir"] = report_dir
@@ -509,9 +616,10 @@ def describe(pkgpath: str, config: str = "", report_dir: str = ""):
             reports(pkg, report_dir)
 
     tmpl = get_template("dpkg_describe.template")
-    res["resources"] = glom(
-        pkg["resources"], [{"fields": ("schema.fields", ["name"]), "path": "path"}]
-    )
+    res["resources"] = [
+        {"fields": [f["name"] for f in r["schema"]["fields"]], "path": r["path"]}
+        for r in pkg["resources"]
+    ]
     return tmpl.render(res)
 
 
@@ -528,6 +636,8 @@ def describe_registry(column_type: str = ""):
     from rich.console import Console
     from rich.markdown import Markdown
 
+    from friendly_data.doc import page
+
     console = Console()
     md = Markdown(page(markup="md", col_t=column_type))
     console.print(md)
@@ -535,7 +645,6 @@ def describe_registry(column_type: str = ""):
 
 def main():  # pragma: no cover, CLI entry point
     """Entry point for console scripts"""
-    import os
     import fire
 
     os.environ["PAGER"] = "cat"
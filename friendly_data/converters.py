@@ -24,13 +24,18 @@ Type mapping between the frictionless specification and pandas types:
 
 """
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 from logging import getLogger, warn
 from pathlib import Path
-from typing import Callable, cast, Dict, Hashable, Iterable, List, Tuple, Union
+from typing import Any, Callable, cast, Dict, Hashable, Iterable, List, Tuple, Union
 
 from frictionless import Resource
-from glom import glom, Iter, T
+import numpy as np
 import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
 import xarray as xr
 
 from friendly_data._types import _path_t, _dfseries_t
@@ -38,7 +43,6 @@ from friendly_data.dpkg import resource_
 from friendly_data.dpkg import fullpath
 from friendly_data.dpkg import get_aliased_cols
 from friendly_data.dpkg import index_levels
-from friendly_data.helpers import consume
 from friendly_data.helpers import import_from
 from friendly_data.helpers import noop_map
 from friendly_data.helpers import sanitise
@@ -63,8 +67,27 @@ _pd_readers = {
     "xlsx": "read_excel",
     # "sqlite": "read_sql",
 }
+# upper limit on threads used to read/write multiple files concurrently
+_MAX_IO_WORKERS = 8
 
 
+def _io_map(func: Callable, items: Iterable) -> List[Any]:
+    """Apply ``func`` to ``items`` concurrently, and return the results in order
+
+    Meant for I/O bound functions like reading or writing files; the
+    ``pandas`` (and ``pyarrow``) parsers release the GIL, so the files are
+    processed in parallel.  Any exception is raised when collecting the result.
+
+    """
+    items = list(items)
+    max_workers = min(_MAX_IO_WORKERS, len(items))
+    if max_workers < 2:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
+
+
+@lru_cache(maxsize=1024)
 def _source_type(source: _path_t) -> str:
     """From a file path, deduce the file type from the extension
 
@@ -78,9 +101,103 @@ def _source_type(source: _path_t) -> str:
     return source_t
 
 
+@lru_cache(maxsize=None)
+def _get_reader(source_t: str) -> Callable:
+    """Resolve the ``pandas`` reader for a file type once, and cache it"""
+    return cast(Callable, import_from("pandas", _pd_readers[source_t]))
+
+
+@lru_cache(maxsize=None)
+def _has_pyarrow() -> bool:
+    return find_spec("pyarrow") is not None
+
+
+# options understood by `_read_csv_arrow`, same as what `to_df` passes on
+_ARROW_OPTS = {"dtype", "na_values", "index_col", "parse_dates", "skiprows"}
+
+
+def _read_csv_arrow(
+    fpath: _path_t,
+    *,
+    dtype: Dict[str, str],
+    na_values: Union[Iterable[str], None],
+    index_col: Union[str, List[str], bool],
+    parse_dates: List[str],
+    skiprows: Union[int, None],
+) -> pd.DataFrame:
+    """Read a CSV file with the multithreaded :mod:`pyarrow` CSV parser
+
+    The options have the same meaning as in :func:`pandas.read_csv`; columns
+    in ``dtype`` are parsed as the corresponding type, other columns are
+    inferred.  Unlike :func:`pandas.read_csv`, :mod:`pyarrow` also infers
+    dates, so the file is read again if any dates that were not requested
+    are found, with those columns as text.
+
+    Raises
+    ------
+    ValueError
+        If any of the requested dates are timezone aware, :mod:`pyarrow`
+        cannot keep their UTC offsets; the caller should use pandas instead
+
+
+    """
+    import pyarrow as pa
+    from pyarrow import csv
+
+    pa_types = {
+        "bool": pa.bool_(),
+        "Int64": pa.int64(),
+        "float": pa.float64(),
+        "string": pa.string(),
+    }
+    column_types = {col: pa_types[col_t] for col, col_t in dtype.items()}
+
+    def _read() -> pa.Table:
+        return csv.read_csv(
+            fpath,
+            read_options=csv.ReadOptions(skip_rows=skiprows or 0),
+            convert_options=csv.ConvertOptions(
+                column_types=column_types,
+                null_values=sorted(STR_NA_VALUES.union(na_values or ())),
+                strings_can_be_null=True,
+            ),
+        )
+
+    table = _read()
+    # NOTE: date inference cannot be turned off, and casting back to text
+    # reformats the values (e.g. "10:00" -> "10:00:00"), so read them as text
+    text_cols = [
+        field.name
+        for field in table.schema
+        if pa.types.is_temporal(field.type) and field.name not in parse_dates
+    ]
+    if text_cols:
+        column_types.update((col, pa.string()) for col in text_cols)
+        table = _read()
+    for field in table.schema:
+        # NOTE: pyarrow converts UTC offsets to UTC, whereas pandas keeps them
+        if field.name in parse_dates and getattr(field.type, "tz", None):
+            raise ValueError(f"{field.name}: timezone aware dates")
+    df = table.to_pandas()
+    df = df.astype({col: col_t for col, col_t in dtype.items() if col in df.columns})
+    for col in parse_dates:  # pyarrow timestamps may not be in ns
+        dates = pd.to_datetime(df[col])
+        df[col] = dates if dates.dt.tz else dates.astype("datetime64[ns]")
+    return df if index_col is False else df.set_index(index_col)
+
+
 def _reader(fpath, **kwargs) -> _dfseries_t:
-    reader = cast(Callable, import_from("pandas", _pd_readers[_source_type(fpath)]))
-    return reader(fpath, **kwargs)
+    source_t = _source_type(fpath)
+    # use the multithreaded `pyarrow` CSV parser when available, and no other
+    # reader options are requested
+    if source_t == "csv" and _has_pyarrow() and _ARROW_OPTS.issuperset(kwargs):
+        import pyarrow as pa
+
+        try:
+            return _read_csv_arrow(fpath, **kwargs)
+        except (pa.ArrowException, ValueError, TypeError) as err:
+            logger.debug(f"{fpath}: {err}, falling back to pandas")
+    return _get_reader(source_t)(fpath, **kwargs)
 
 
 def _schema(resource: Resource, type_map: Dict[str, str]) -> Dict[str, str]:
@@ -99,14 +216,37 @@ def _schema(resource: Resource, type_map: Dict[str, str]) -> Dict[str, str]:
         Dictionary with column names as key, and types as values
 
     """
-    remap_types = lambda t: (t["name"], type_map[t["type"]])  # noqa: E731
-    return glom(resource, ("schema.fields", [remap_types], dict))
+    return {f["name"]: type_map[f["type"]] for f in resource["schema"]["fields"]}
+
+
+def _to_datetime(df: pd.DataFrame, fmts: Dict[str, str]) -> pd.DataFrame:
+    """Convert text columns (or index levels) to timestamps with a known format
+
+    Parsing with an explicit format is much faster than inferring one, and
+    repeated values are only parsed once.  Only the unique values of index
+    levels are converted.
+
+    Raises
+    ------
+    ValueError
+        If a value does not match its format
+
+    """
+    for col, fmt in fmts.items():
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format=fmt, cache=True)
+        elif isinstance(df.index, pd.MultiIndex) and col in df.index.names:
+            lvl = df.index.levels[df.index.names.index(col)]
+            df.index = df.index.set_levels(pd.to_datetime(lvl, format=fmt), level=col)
+        elif col == df.index.name:
+            df.index = pd.to_datetime(df.index, format=fmt, cache=True)
+    return df
 
 
 def to_df(resource: Resource, noexcept: bool = False, **kwargs) -> pd.DataFrame:
     """Reads a data package resource as a `pandas.DataFrame`
 
-    FIXME: 'format' in the schema is ignored.
+    FIXME: 'format' in the schema is ignored, except for date/time columns.
 
     Parameters
     ----------
@@ -116,7 +256,9 @@ def to_df(resource: Resource, noexcept: bool = False, **kwargs) -> pd.DataFrame:
         Whether to suppress an exception
     **kwargs
         Additional keyword arguments that are passed on to the reader:
-        :func:`pandas.read_csv`, :func:`pandas.read_excel`, etc
+        :func:`pandas.read_csv`, :func:`pandas.read_excel`, etc.  If a list of
+        column names is passed as ``usecols``, only those columns (and the
+        index columns) are read and converted, which is faster for wide tables.
 
     Returns
     -------
@@ -131,32 +273,47 @@ def to_df(resource: Resource, noexcept: bool = False, **kwargs) -> pd.DataFrame:
         If the source type the resource is pointing to isn't supported
 
     """
-    from pandas._libs.parsers import STR_NA_VALUES
-
-    # parse dates
-    schema = _schema(resource, _pd_types)
-    date_cols = [col for col, col_t in schema.items() if "datetime64" in col_t]
-    consume(map(schema.pop, date_cols))
+    # NOTE: the resource schema is read with plain dictionary lookups, and the
+    # fields are parsed in one pass; this is the bulk of the work for small
+    # files, and is repeated for every resource in `to_mfdst`
+    res_schema = resource["schema"]
+
+    # parse dates, separate them from the other columns; dates with an explicit
+    # format are read as text, and converted after reading
+    schema: Dict[str, str] = {}
+    date_cols: List[str] = []
+    date_fmts: Dict[str, str] = {}
+    alias = noop_map()
+    for field in res_schema["fields"]:
+        col, col_t = field["name"], _pd_types[field["type"]]
+        fmt = field.get("format", "default")
+        if "datetime64" not in col_t:
+            schema[col] = col_t
+        elif fmt in ("default", "any"):
+            date_cols.append(col)
+        else:
+            schema[col] = "string"
+            date_fmts[col] = fmt
+        if "alias" in field:
+            alias[col] = field["alias"]
 
     # missing values, NOTE: pandas accepts a list of "additional" tokens to be
-    # treated as missing values.
-    na_values = (
-        glom(resource, ("schema.missingValues", set), default=set()) - STR_NA_VALUES
-    )
-    # FIXME: check if empty set is the same as None
+    # treated as missing values; without any, pass None to use the defaults.
+    na_values = (set(res_schema.get("missingValues", ())) - STR_NA_VALUES) or None
 
     # FIXME: how to handle constraints? e.g. 'required', 'unique', 'enum', etc
     # see: https://specs.frictionlessdata.io/table-schema/#constraints
 
     # set 'primaryKey' as index_col, a list is interpreted as a MultiIndex
-    index_col = glom(resource, ("schema.primaryKey"), default=False)
+    index_col = res_schema.get("primaryKey", False)
     if isinstance(index_col, list):
         # guard against schema, that includes an index column
         [schema.pop(col) for col in index_col if col in schema]
 
     # FIXME: skip_rows is 1-indexed, whereas skiprows is either an offset or
     # 0-indexed (see FIXME in `resource_`)
-    skiprows = glom(resource, ("layout.skipRows", len), default=None)
+    skip_rows = resource.get("layout", {}).get("skipRows")
+    skiprows = None if skip_rows is None else len(skip_rows)
 
     # don't let the user override the options we use
     [
@@ -164,17 +321,14 @@ def to_df(resource: Resource, noexcept: bool = False, **kwargs) -> pd.DataFrame:
         for k in ("dtype", "na_values", "index_col", "parse_dates", "skiprows")
     ]
 
-    alias = glom(
-        resource,
-        (
-            "schema.fields",
-            Iter()
-            .filter(lambda i: "alias" in i)
-            .map(({1: "name", 2: "alias"}, T.values()))
-            .all(),
-            noop_map,
-        ),
-    )
+    # only convert the requested columns; the index is always needed
+    usecols = kwargs.get("usecols")
+    if isinstance(usecols, (list, tuple)) and all(isinstance(c, str) for c in usecols):
+        idxcols = [index_col] if isinstance(index_col, str) else (index_col or [])
+        kwargs["usecols"] = usecols = list(dict.fromkeys([*idxcols, *usecols]))
+        schema = {col: col_t for col, col_t in schema.items() if col in usecols}
+        date_cols = [col for col in date_cols if col in usecols]
+
     try:
         # FIXME: validate options
         df = _reader(
@@ -185,7 +339,8 @@ def to_df(resource: Resource, noexcept: bool = False, **kwargs) -> pd.DataFrame:
             parse_dates=date_cols,
             skiprows=skiprows,
             **kwargs,
-        ).rename(columns=alias)
+        )
+        df = _to_datetime(df, date_fmts).rename(columns=alias)
     except ValueError:
         if noexcept:
             return pd.DataFrame()
@@ -225,13 +380,44 @@ def xr_metadata(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict, Dict]:
         levels = [df.index]
     coords = {name: lvls for name, lvls in zip(names, levels) if name not in const}
     attrs = {name: lvls[0] for name, lvls in zip(names, levels) if name in const}
-    idx_aligned = pd.MultiIndex.from_product(coords.values())
     if const[0] in df.index.names:  # FIXME: resolve items in const set in index
         df = df.reset_index(const, drop=True)
-    df = df.reindex(idx_aligned)
+    # NOTE: reindexing is expensive, skip when already aligned (common case);
+    # reindexing copies, so copy otherwise, arrays created from the result
+    # should not share memory with the caller's dataframe
+    if _is_aligned(df.index, coords):
+        df = df.copy()
+    else:
+        df = df.reindex(pd.MultiIndex.from_product(coords.values()))
     return df, coords, attrs
 
 
+def _is_aligned(idx: pd.Index, coords: Dict[Hashable, pd.Index]) -> bool:
+    """Whether the index has every combination of coordinates, in product order
+
+    In that case, reindexing with :meth:`pandas.MultiIndex.from_product` would
+    return an identical dataframe.  The check uses the integer codes of the
+    index, so no hashing or sorting is required.
+
+    """
+    # NOTE: reindexing a flat index returns a 1-level MultiIndex, always reindex
+    if not isinstance(idx, pd.MultiIndex):
+        return False
+    shape = [len(lvl) for lvl in coords.values()]
+    if len(idx) != np.prod(shape) or not all(
+        lvl.is_monotonic_increasing for lvl in coords.values()
+    ):
+        return False
+    if list(idx.names) != list(coords) or not all(
+        lvl.equals(coord) for lvl, coord in zip(idx.levels, coords.values())
+    ):
+        return False
+    if any((codes < 0).any() for codes in idx.codes):  # missing values
+        return False
+    pos = np.ravel_multi_index(idx.codes, shape)
+    return bool((pos == np.arange(len(idx))).all())
+
+
 def xr_da(
     df: pd.DataFrame,
     col: Union[int, Hashable],
@@ -258,11 +444,19 @@ def xr_da(
     xarray.DataArray
 
     """
-    indexer = getattr(df, "iloc" if isinstance(col, int) else "loc")
-    arr = indexer[:, col].values
-    if isinstance(arr, pd.api.extensions.ExtensionArray):
-        arr = arr.to_numpy()
-    data = arr.reshape(tuple(map(len, coords.values())))
+    series = df.iloc[:, col] if isinstance(col, int) else df[col]
+    dtype = getattr(series.dtype, "numpy_dtype", None)  # masked (nullable) arrays
+    if dtype is None:
+        arr = series.to_numpy()
+    elif series.hasnans:  # NOTE: integers & booleans cannot hold NaN
+        if dtype.kind in "iuf":
+            arr = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            arr = series.to_numpy(dtype=object)
+    else:
+        arr = series.to_numpy(dtype=dtype)
+    # NOTE: xarray expects row-major data, reshaping a contiguous array is free
+    data = np.ascontiguousarray(arr).reshape(tuple(map(len, coords.values())))
     return xr.DataArray(
         data=data, coords=coords, dims=coords.keys(), attrs=attrs, **kwargs
     )
@@ -334,7 +528,20 @@ def to_dst(resource: Resource, noexcept: bool = False, **kwargs) -> xr.Dataset:
     if df.empty and noexcept:
         return xr.Dataset()
     df, coords, attrs = xr_metadata(df)
-    data_vars = {col: xr_da(df, col, coords=coords, attrs=attrs) for col in df.columns}
+    dtypes = set(df.dtypes)
+    if len(dtypes) == 1 and isinstance(dtypes.pop(), np.dtype):
+        # NOTE: columns with the same numpy dtype share one block, transposing
+        # is a view, so every column is a contiguous slice of the same array
+        block = np.ascontiguousarray(df.to_numpy().T)
+        shape, dims = tuple(map(len, coords.values())), list(coords)
+        data_vars = {
+            col: xr.DataArray(block[i].reshape(shape), coords, dims, attrs=attrs)
+            for i, col in enumerate(df.columns)
+        }
+    else:
+        data_vars = {
+            col: xr_da(df, col, coords=coords, attrs=attrs) for col in df.columns
+        }
     return xr.Dataset(data_vars=data_vars, **kwargs)
 
 
@@ -366,8 +573,9 @@ def to_mfdst(
 
     """
     data_vars: Dict[Hashable, xr.DataArray] = {}
-    for res in resources:
-        df = to_df(res, noexcept)
+    # NOTE: reading is independent for each resource, so read them concurrently,
+    # but build the data arrays in order, so that later columns win
+    for df in _io_map(lambda res: to_df(res, noexcept), resources):
         if df.empty and noexcept:
             continue
         df, coords, attrs = xr_metadata(df)
@@ -377,7 +585,9 @@ def to_mfdst(
     return xr.Dataset(data_vars=data_vars, **kwargs)
 
 
-def resolve_aliases(df: _dfseries_t, alias: Dict[str, str]) -> _dfseries_t:
+def resolve_aliases(
+    df: _dfseries_t, alias: Dict[str, str], *, copy: bool = True
+) -> _dfseries_t:
     """Return a copy of the dataframe with aliases resolved
 
     Parameters
@@ -390,6 +600,11 @@ def resolve_aliases(df: _dfseries_t, alias: Dict[str, str]) -> _dfseries_t:
         column name in the dataframe, and the value is a column in the
         registry.
 
+    copy : bool (default: True)
+        Copy the data.  Without a copy, only the labels are new, and the data
+        is shared with the original; so modifying one modifies the other.  Use
+        it only when the result is not modified, e.g. when writing to a file.
+
     Returns
     -------
     pd.DataFrame | pd.Series
@@ -397,9 +612,13 @@ def resolve_aliases(df: _dfseries_t, alias: Dict[str, str]) -> _dfseries_t:
         that the original dataframe/series remains unaltered.
 
     """
-    # work w/ a copy, not very memory efficient
-    _df = cast(_dfseries_t, df.rename(alias, axis=1))  # noop for pd.series
-    _df.index = _df.index.rename(alias)
+    if isinstance(df, pd.DataFrame):
+        _df = cast(_dfseries_t, df.rename(columns=alias, copy=copy))
+    else:  # nothing to rename for a series
+        _df = df.copy(deep=copy)
+    if any(name in alias for name in _df.index.names):
+        # NOTE: set a new index, as the index is shared with `df`
+        _df.index = _df.index.set_names([alias.get(n, n) for n in _df.index.names])
     return _df
 
 
@@ -453,7 +672,8 @@ def from_df(
     fullpath = Path(basepath) / datapath
     # ensure parent directory exists
     fullpath.parent.mkdir(parents=True, exist_ok=True)
-    _df = resolve_aliases(df, alias) if rename else df
+    # NOTE: only written to a file, no need to copy the data
+    _df = resolve_aliases(df, alias, copy=False) if rename else df
     # don't write index if default/unnamed index
     defaultidx = (
         False if isinstance(_df.index, pd.MultiIndex) else _df.index.name is None
@@ -483,6 +703,36 @@ def from_df(
     return resource_(spec, basepath=basepath)
 
 
+def _notna_df(da: xr.DataArray) -> pd.DataFrame:
+    """Convert a data array to a dataframe, skipping missing values
+
+    Equivalent to ``da.to_dataframe().dropna()``, but only the rows with
+    values are created, instead of a row for every combination of coordinates
+    (most of which are missing in a sparse array).  Falls back to the above
+    when there are non-dimension coordinates, or dimensions without a unique
+    index.
+
+    """
+    dims = da.dims
+    if (
+        da.ndim == 0
+        or set(da.coords) != set(dims)
+        or not all(dim in da.indexes and da.indexes[dim].is_unique for dim in dims)
+    ):
+        return da.to_dataframe().dropna()
+    values = da.values.ravel()
+    (pos,) = np.nonzero(pd.notna(values))
+    if da.ndim == 1:
+        index = da.indexes[dims[0]][pos]
+    else:
+        index = pd.MultiIndex(
+            levels=[da.indexes[dim] for dim in dims],
+            codes=np.unravel_index(pos, da.shape),
+            names=list(dims),
+        )
+    return pd.DataFrame({da.name: values[pos]}, index=index)
+
+
 def from_dst(
     dst: xr.Dataset,
     basepath: _path_t,
@@ -492,7 +742,8 @@ def from_dst(
 
     Each data variable is written to a separate CSV file in the directory
     specified by `basepath`.  The file name is derived from the data variable
-    name by sanitising it and appending the CSV extension.
+    name by sanitising it and appending the CSV extension.  The files are
+    written concurrently.
 
     Parameters
     ----------
@@ -512,14 +763,22 @@ def from_dst(
     List[Resource]
         List of data package resources that point to the CSV files.
 
+    Raises
+    ------
+    ValueError
+        If more than one data variable maps to the same file name after
+        sanitising (e.g. "a b" and "a_b"); nothing is written
+
     """
-    resources = [
-        from_df(
-            da.to_dataframe().dropna(),
-            basepath,
-            datapath=f"{sanitise(var)}.csv",  # type: ignore[arg-type]
-            alias=alias,
-        )
-        for var, da in dst.data_vars.items()
-    ]
-    return resources
+    fnames = [f"{sanitise(var)}.csv" for var in dst.data_vars]  # type: ignore[arg-type]
+    dups = sorted(fname for fname, count in Counter(fnames).items() if count > 1)
+    if dups:
+        raise ValueError(f"data variables write to the same files: {dups}")
+
+    def _write(fname_da: Tuple[str, xr.DataArray]) -> Resource:
+        fname, da = fname_da
+        return from_df(_notna_df(da), basepath, datapath=fname, alias=alias)
+
+    # NOTE: each data variable is written to a separate file, so write them
+    # concurrently; the resources are returned in the same order
+    return _io_map(_write, zip(fnames, dst.data_vars.values()))
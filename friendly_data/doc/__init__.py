@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict
 
 from jinja2 import BaseLoader, Environment, FileSystemLoader
@@ -13,10 +14,18 @@ def template_from_str(template: str):
     return Environment(loader=BaseLoader()).from_string(template)
 
 
-def get_template(name: str):
+@lru_cache(maxsize=None)
+def _env() -> Environment:
+    # create the environment once, so that compiled templates are cached; the
+    # templates are package data, and do not change while running
     loader = FileSystemLoader(searchpath=resource_filename("friendly_data", "doc"))
-    env = Environment(loader=loader, trim_blocks=True, lstrip_blocks=True)
-    return env.get_template(name)
+    return Environment(
+        loader=loader, trim_blocks=True, lstrip_blocks=True, auto_reload=False
+    )
+
+
+def get_template(name: str):
+    return _env().get_template(name)
 
 
 def entry(schema: Dict, f: str, markup: str = "rst") -> str:
@@ -14,7 +14,7 @@ from glom import Assign, Coalesce, glom, Invoke, Iter, Spec, SKIP
 from glom import Match, MatchError, Optional as optmatch, Or
 import pandas as pd
 
-from friendly_data.io import dwim_file, path_not_in, posixpathstr, relpaths
+from friendly_data.io import dwim_file, posixpathstr, relpaths
 from friendly_data.helpers import match, noop_map, is_windows
 from friendly_data.metatools import resolve_licenses
 from friendly_data._types import _path_t, _dfseries_t
@@ -705,9 +705,11 @@ def pkg_from_files(
     idx: Union[pkgindex, None]
     if idxpath:
         pkgdir, pkg, idx = pkg_from_index(meta, idxpath)
-        # convert to full path
-        idx_fpath = map(pkgdir.__truediv__, glom(idx, ["path"]))
-        _fpaths = relpaths(pkgdir, filter(lambda p: path_not_in(idx_fpath, p), fpaths))
+        # resolve to full paths once, and test membership in a set
+        idx_fpaths = frozenset((pkgdir / p).resolve() for p in glom(idx, ["path"]))
+        _fpaths = relpaths(
+            pkgdir, [p for p in fpaths if Path(p).resolve() not in idx_fpaths]
+        )
         pkg = create_pkg(pkg, _fpaths, basepath=pkgdir)
     else:
         pkgdir = fpath
@@ -2,15 +2,17 @@
 
 from collections import deque
 from collections.abc import Sequence
-from functools import partial
+from functools import lru_cache, partial
 from importlib import import_module
 from logging import getLogger
 import re
 import sys
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
 
 from glom import Check, Match, SKIP
-import pandas as pd
+
+if TYPE_CHECKING:  # pragma: no cover, avoid importing pandas at runtime
+    import pandas as pd
 
 logger = getLogger(__name__)
 
@@ -32,9 +34,13 @@ def is_windows() -> bool:
     return sys.platform in ("win32", "cygwin")
 
 
+_SANITISE_RE = re.compile("[^ @&()/]+")
+
+
+@lru_cache(maxsize=1024)  # the same names are sanitised repeatedly
 def sanitise(string: str) -> str:
     """Sanitise string for use as group/directory name"""
-    return "_".join(re.findall(re.compile("[^ @&()/]+"), string))
+    return "_".join(_SANITISE_RE.findall(string))
 
 
 def is_fmtstr(string: str) -> bool:
@@ -77,7 +83,7 @@ class noop_map(dict):
         return key
 
 
-def idx_lvl_values(idx: pd.MultiIndex, name: str) -> pd.Index:
+def idx_lvl_values(idx: "pd.MultiIndex", name: str) -> "pd.Index":
     """Given a ``pandas.MultiIndex`` and a level name, find the level values
 
     Parameters
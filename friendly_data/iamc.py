@@ -8,16 +8,18 @@ IAMC variable name, defining column aliases, and aggregations can be done in an
 index file (in YAML format).
 
 """
+from copy import deepcopy
 from itertools import chain
 from logging import getLogger
 from pathlib import Path
 from typing import cast, Dict, Iterable, List, Tuple, Union
 
 from glom import glom, Iter, Match, MatchError, Or, T
+import numpy as np
 import pandas as pd
 
 from friendly_data._types import _path_t
-from friendly_data.converters import _reader, resolve_aliases, to_df
+from friendly_data.converters import _io_map, _reader, resolve_aliases, to_df
 from friendly_data.dpkg import pkgindex
 from friendly_data.dpkg import res_from_entry
 from friendly_data.helpers import idx_lvl_values, idxslice
@@ -50,18 +52,18 @@ class IAMconv:
     """
 
     _IAMC_IDX = pyam.IAMC_IDX + ["year"]
+    _CONF_MATCH = Match(
+        {
+            "indices": {str: Or(str, int)},  # int for year
+            str: object,  # fall through for other config keys
+        }
+    )
 
     @classmethod
     def _validate(cls, conf: Dict) -> Dict:
         # FIXME: check if file exists for user defined idxcols
-        conf_match = Match(
-            {
-                "indices": {str: Or(str, int)},  # int for year
-                str: object,  # fall through for other config keys
-            }
-        )
         try:
-            return glom(conf, conf_match)
+            return glom(conf, cls._CONF_MATCH)
         except MatchError as err:
             logger.exception(
                 f"{err.args[1]}: must define a dictionary of files pointing to idxcol"
@@ -151,7 +153,13 @@ class IAMconv:
 
     @res_idx.setter
     def res_idx(self, idx: pkgindex):
-        self._res_idx = pkgindex(glom(idx, Iter().filter(T.get("iamc")).all()))
+        self._res_idx = pkgindex([entry for entry in idx if entry.get("iamc")])
+        # NOTE: res_from_entry requires: "path", "idxcols", "alias"; later in
+        # the conversion, "iamc" & "agg" is required.  Items are matched on
+        # "path" or "name" (see `_match_item`); normalise the entries once,
+        # instead of for every item that is matched.
+        keys = ["path", "name", "idxcols", "alias", "iamc", "agg"]
+        self._records = self._res_idx.records(keys)
 
     def __init__(self, idx: pkgindex, indices: Dict, basepath: _path_t):
         """Converter initialised with a set of IAMC variable index column defintions
@@ -217,14 +225,20 @@ class IAMconv:
 
     def iamcify(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform dataframe to match the IAMC (long) format"""
-        useridxlvls = list(set(df.index.names) - set(self._IAMC_IDX))
-        # ensure all user defined index columns are removed before concatinating
-        df = (
-            df.rename(columns={df.columns[0]: "value"})
-            .set_index("variable", append=True)
-            .reset_index(useridxlvls, drop=True)
+        # NOTE: build the IAMC index directly from the existing levels and the
+        # "variable" column; this also drops the user defined index columns
+        # before concatinating.  Only the new "variable" level is factorised.
+        var_codes, var_lvl = pd.factorize(df["variable"])
+        lvls = dict(zip(df.index.names, zip(df.index.levels, df.index.codes)))
+        lvls["variable"] = (var_lvl, var_codes)
+        index = pd.MultiIndex(
+            levels=[lvls[col][0] for col in self._IAMC_IDX],
+            codes=[lvls[col][1] for col in self._IAMC_IDX],
+            names=self._IAMC_IDX,
+            verify_integrity=False,
         )
-        df.index = df.index.reorder_levels(self._IAMC_IDX)
+        df = df.rename(columns={df.columns[0]: "value"}).drop(columns="variable")
+        df.index = index
         return df
 
     def agg_idxcol(self, df: pd.DataFrame, col: str, entry: Dict) -> List[pd.DataFrame]:
@@ -252,7 +266,10 @@ class IAMconv:
             rest = df.index.names.difference([col])
             _df = cast(
                 pd.DataFrame,
-                df.query(f"{col} in @lvls").groupby(rest).sum().assign(variable=var),
+                df[df.index.get_level_values(col).isin(lvls)]
+                .groupby(rest)
+                .sum()
+                .assign(variable=var),
             )
             dfs.append(self.iamcify(_df))
         return dfs
@@ -291,17 +308,16 @@ class IAMconv:
             match_key = "path"
             match_val = f"{item}"
 
-        # NOTE: res_from_entry requires: "path", "idxcols", "alias"; later
-        # in the iteration, "iamc" & "agg" is required
-        keys = [match_key, "idxcols", "alias", "iamc", "agg"]
         _entries = [
             entry
-            for entry in self.res_idx.records(keys)
+            for entry in self._records
             # convert to string for path comparison
             if f"{match_val}" == entry[match_key]
         ]
         if _entries:
-            entry = _entries[0]
+            # NOTE: `res_from_entry` modifies the entry, and items may be matched
+            # concurrently, so never hand out the cached records
+            entry = deepcopy(_entries[0])
             if len(_entries) > 1:
                 logger.warning(f"{entry[match_key]}: duplicate entries, picking first")
         else:
@@ -336,18 +352,20 @@ class IAMconv:
             A ``pandas.DataFrame`` in IAMC format
 
         """
-        dfs = []
         if isinstance(files_or_dfs, dict):
             iterable = cast(Iterable, files_or_dfs.items())
         else:
             iterable = files_or_dfs
 
-        for item in iterable:
+        def _convert(item) -> List[pd.DataFrame]:
             match = self._match_item(item)
-            if match is None:
-                continue
-            res = self.frames(*match)  # match -> entry, dataframe
-            dfs.append(res)
+            # match -> entry, dataframe
+            return [] if match is None else self.frames(*match)
+
+        # NOTE: files are read & converted concurrently, converting in the same
+        # task means only the (smaller) converted frames are kept in memory;
+        # the results are in the same order as the files
+        dfs = _io_map(_convert, iterable)
         df = pd.concat(chain.from_iterable(dfs), axis=0)
         if df.empty:
             logger.warning("empty data set, check config and index file")
@@ -377,11 +395,12 @@ class IAMconv:
 
         if entry["agg"]:  # None if not defined
             col, _agg_vals = self.agg_vals_all(entry)
-            df_agg = cast(pd.DataFrame, df.query(f"{col} in @_agg_vals"))
+            # NOTE: boolean masks avoid parsing a query expression every time
+            col_vals = df.index.get_level_values(col)
+            df_agg = cast(pd.DataFrame, df[col_vals.isin(_agg_vals)])
             dfs.extend(self.agg_idxcol(df_agg, col, entry))
 
-            _vals = lvls[col].index  # noqa: F841, used by query below
-            df = cast(pd.DataFrame, df.query(f"{col} in @_vals"))
+            df = cast(pd.DataFrame, df[col_vals.isin(lvls[col].index)])
 
             # NOTE: need to remove aggregated levels, then calculate the
             # intersection with the levels that are in the current dataframe
@@ -408,13 +427,26 @@ class IAMconv:
             )
             df = df.loc[sel]
             df.index = df.index.remove_unused_levels()
-            iamc_variable = pd.DataFrame(
-                {
-                    col: df.index.get_level_values(col).map(val)
-                    for col, val in _lvls.items()
-                },
-                index=df.index,
-            ).apply(lambda r: entry["iamc"].format(**r.to_dict()), axis=1)
+            # NOTE: format the variable once per unique combination of index
+            # values, then broadcast to all rows.  The combinations are found
+            # from the integer codes of the index levels, so only the unique
+            # level values are mapped to their IAMC names.
+            lvl_nums = [df.index.names.index(col) for col in _lvls]
+            shape = [len(df.index.levels[i]) for i in lvl_nums]
+            codes, uniques = pd.factorize(
+                np.ravel_multi_index([df.index.codes[i] for i in lvl_nums], shape)
+            )
+            names = [
+                df.index.levels[i].take(lvl_codes).map(vals)
+                for i, lvl_codes, vals in zip(
+                    lvl_nums, np.unravel_index(uniques, shape), _lvls.values()
+                )
+            ]
+            fmt = entry["iamc"]
+            iamc_variable = np.array(
+                [fmt.format(**dict(zip(_lvls, vals))) for vals in zip(*names)],
+                dtype=object,
+            )[codes]
         else:
             iamc_variable = entry["iamc"]
         _df = self.iamcify(df.assign(variable=iamc_variable))
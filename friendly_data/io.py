@@ -2,6 +2,9 @@
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
 from hashlib import sha256
 import json
 from pathlib import Path
@@ -10,14 +13,17 @@ import tempfile
 import time
 from typing import Any, Dict, Iterable, List, overload, Tuple, Union
 
-import requests
 import yaml
 
 from friendly_data._types import _path_t
 
+# use the faster libyaml based (de)serialisers when available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def copy_files(
-    src: Iterable[_path_t], dest: _path_t, anchor: _path_t = ""
+    src: Iterable[_path_t], dest: _path_t, anchor: _path_t = "", max_workers: int = 1
 ) -> List[Path]:
     """Copy files to a directory
 
@@ -38,10 +44,15 @@ def copy_files(
         paths between the source files to be maintained with respect to this
         directory.
 
+    max_workers : int (default: 1)
+        Number of threads used to copy the files; copying is I/O bound, so
+        with many files, copying them concurrently can be faster
+
     Returns
     -------
     List[Path]
-        List of files that were copied
+        List of files in the destination directory; files that are already
+        up to date (same size and modification time) are not copied again
 
     """
     dest = Path(dest)
@@ -50,15 +61,39 @@ def copy_files(
         anchor = Path(anchor)
         if not anchor.is_dir():
             anchor = anchor.parent
-    files = []
+    srcs, files = [], []
     for fp in src:
         fp = Path(fp)
+        srcs.append(fp)
         files.append(dest / (fp.relative_to(anchor) if anchor else fp.name))
         files[-1].parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(fp, files[-1].parent)
+    pending = [(fp, _dest) for fp, _dest in zip(srcs, files) if _outdated(fp, _dest)]
+    # NOTE: for a handful of files, starting threads costs more than it saves
+    if max_workers > 1 and len(pending) >= 4:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # NOTE: consume the iterator so that any exception is raised here
+            list(executor.map(lambda p: shutil.copy2(*p), pending))
+    else:
+        for fp, _dest in pending:
+            shutil.copy2(fp, _dest)
     return files
 
 
+def _outdated(src: Path, dest: Path) -> bool:
+    """Whether ``dest`` is missing, or differs from ``src`` (size or mtime)
+
+    :func:`shutil.copy2` preserves the modification time, so a previous copy
+    that has not been modified since matches the source.
+
+    """
+    try:
+        dst_st = dest.stat()
+    except FileNotFoundError:
+        return True
+    src_st = src.stat()
+    return (src_st.st_size, src_st.st_mtime_ns) != (dst_st.st_size, dst_st.st_mtime_ns)
+
+
 def relpaths(basepath: _path_t, pattern: Union[str, Iterable[_path_t]]) -> List[str]:
     """Convert a list of paths to relative paths
 
@@ -171,6 +206,12 @@ def posixpathstr(fpath: _path_t) -> str:
     return str(Path(fpath).as_posix())
 
 
+@lru_cache(maxsize=128)
+def _load_yaml(fpath: Path, stat: Tuple[int, ...]) -> Union[Dict, List]:
+    """Parse a YAML file; cached on the file status, see :func:`dwim_file`"""
+    return yaml.load(fpath.read_text(), Loader=_YamlLoader)
+
+
 @overload
 def dwim_file(fpath: _path_t) -> Union[Dict, List]:
     ...  # pragma: no cover, overload
@@ -188,6 +229,12 @@ def dwim_file(fpath, data=None):
     write data to the file.  The file type is guessed from the extension;
     supported formats: JSON and YAML.
 
+    Parsed YAML files are cached on their path, and file status (inode, size,
+    modification & status change time), so reading the same file repeatedly
+    (e.g. the index, or a config file) is cheap; as long as the file is
+    unchanged, a copy of the cached result is returned.  JSON is fast enough
+    to parse, so it is not cached.
+
     Parameters
     ----------
     fpath : Union[str, Path]
@@ -205,21 +252,24 @@ def dwim_file(fpath, data=None):
 
     """
     fpath = Path(fpath)
-    mode = "r" if data is None else "w"
-    if fpath.suffix in (".yaml", ".yml"):
-        with open(fpath, mode=mode) as stream:
-            if data is None:
-                return yaml.safe_load(stream)
-            else:
-                yaml.safe_dump(data, stream)
-    elif fpath.suffix == ".json":
-        with open(fpath, mode=mode) as stream:
-            if data is None:
-                return json.load(stream)
-            else:
-                json.dump(data, stream, indent=2)
-    else:
+    if fpath.suffix not in (".yaml", ".yml", ".json"):
         raise RuntimeError(f"{fpath}: not a JSON or YAML file")
+    if data is None:
+        if fpath.suffix == ".json":
+            return json.loads(fpath.read_text())
+        # NOTE: parsing YAML is much slower than copying the result; return a
+        # copy, as callers are free to modify the result
+        # NOTE: the modification time can be preserved or set (e.g. `cp -p`,
+        # `rsync -t`), but any change to the file updates the status change
+        # time, and a replaced file has a new inode
+        st = fpath.stat()
+        key = (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+        return deepcopy(_load_yaml(fpath.resolve(), key))
+    with open(fpath, mode="w") as stream:
+        if fpath.suffix == ".json":
+            json.dump(data, stream, indent=2)
+        else:
+            yaml.dump(data, stream, Dumper=_YamlDumper)
 
 
 def get_cachedir() -> Path:
@@ -361,6 +411,8 @@ class HttpCache:
             If the URL is incorrect
 
         """
+        import requests  # slow to import, and only needed for network access
+
         response = requests.get(url)
         if response.ok:
             return response.content
@@ -2,12 +2,13 @@
 
 """
 
+from functools import lru_cache
 import json
 import logging
 from operator import contains
 from typing import Callable, Dict, Iterable, List, Tuple
 
-from glom import Assign, Coalesce, glom, Iter, Spec
+from glom import Coalesce, glom, Iter
 from glom import Match, MatchError
 
 from friendly_data.helpers import filter_dict
@@ -23,6 +24,9 @@ ODLS = "https://licenses.opendefinition.org/licenses/groups/{}.json"
 ODLS_GROUPS = ["all", "osi", "od", "ckan"]
 
 
+# NOTE: the parsed license list is cached for the session, on top of the HTTP
+# cache on disk; callers should not modify the returned dictionary
+@lru_cache(maxsize=len(ODLS_GROUPS))
 def _fetch_license(group: str = "all") -> Dict:
     if group not in ODLS_GROUPS:
         raise ValueError(
@@ -75,8 +79,7 @@ def lic_metadata(
             and "GFDL" not in i["id"]  # weird one, probably won't need
         )
         .filter(pred)
-        .map(Assign("domain", Spec(lic_domain)))
-        .map(lambda i: filter_dict(i, keys))
+        .map(lambda i: filter_dict({**i, "domain": lic_domain(i)}, keys))
         .all(),
     )
     return res
@@ -8,6 +8,8 @@ registry config before customising the default registry.
 """
 
 from contextlib import contextmanager
+from copy import deepcopy
+from functools import lru_cache
 from logging import getLogger
 from typing import cast, Dict, List
 
@@ -153,9 +155,23 @@ def config_ctx(
         _custom.update(save)
 
 
+@lru_cache(maxsize=None)
+def _get_default(col: str, col_t: str) -> Dict:
+    """Cached lookup in the default registry; see :func:`get`
+
+    The default registry is read from the installed package, so it does not
+    change; looking up a column is a directory search and a file read, which
+    is repeated for every column of every dataset written with
+    :func:`friendly_data.converters.from_df`.
+
+    """
+    return _registry.get(col, col_t)
+
+
 def get(col: str, col_t: str) -> Dict:
     global _custom
-    reg = _registry.get(col, col_t)
+    # callers modify the schema (e.g. fill in enum values), return a copy
+    reg = deepcopy(_get_default(col, col_t))
     custom = glom(
         _custom,
         (col_t, Iter().filter(match({"name": col, str: object})).first()),
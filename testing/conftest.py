@@ -3,6 +3,8 @@ import os
 from pathlib import Path
 import re
 from shutil import copytree
+import sys
+from types import ModuleType
 from typing import cast, Dict
 
 import pandas as pd
@@ -16,6 +18,7 @@ from friendly_data.dpkg import pkg_from_index
 from friendly_data.iamc import IAMconv
 from friendly_data.io import dwim_file
 from friendly_data.io import HttpCache
+from friendly_data.metatools import _fetch_license
 from friendly_data.metatools import ODLS
 from friendly_data.helpers import noop_map
 
@@ -85,12 +88,35 @@ def http_cache(request):
         pass
 
 
+@pytest.fixture
+def mock_profiler(monkeypatch):
+    """Replace ``pandas_profiling`` (optional) with a stub
+
+    Returns the list of report files written (only in the current process).
+
+    """
+    reports = []
+
+    class _Report:
+        def to_file(self, fpath):
+            reports.append(fpath)
+            fpath.write_text("<html></html>")
+
+    monkeypatch.setitem(sys.modules, "pandas_profiling", ModuleType("mock"))
+    monkeypatch.setattr(
+        pd.DataFrame, "profile_report", lambda *_, **__: _Report(), raising=False
+    )
+    return reports
+
+
 @pytest.fixture
 def clean_odls_cache():
-    # hack to cleanup cache files
+    # hack to cleanup cache files, and the parsed licenses cached in memory
+    _fetch_license.cache_clear()
     yield
     http_cache = HttpCache(ODLS)
     http_cache.remove()
+    _fetch_license.cache_clear()
 
 
 @pytest.fixture
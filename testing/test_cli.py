@@ -1,12 +1,15 @@
 from itertools import product
 import json
+import multiprocessing
 from pathlib import Path
 from typing import cast, List
 
+from frictionless import Package, Resource
 from glom import glom, Iter
 import pytest
 
 from friendly_data.cli import _metadata, generate_index_file
+from friendly_data.cli import _report
 from friendly_data.cli import create
 from friendly_data.cli import describe
 from friendly_data.cli import list_licenses
@@ -15,7 +18,9 @@ from friendly_data.cli import _create
 from friendly_data.cli import _rm_from_idx
 from friendly_data.cli import _rm_from_pkg
 from friendly_data.cli import _rm_from_disk
+from friendly_data.cli import _table
 from friendly_data.cli import remove
+from friendly_data.cli import reports
 from friendly_data.cli import _update
 from friendly_data.cli import update
 from friendly_data.cli import to_iamc
@@ -162,6 +167,18 @@ def test_update(tmp_pkgdir):
     assert glom(entry, "schema.primaryKey") == meta["idxcols"]
 
 
+def test_update_metadata_only(tmp_pkgdir):
+    _, dest = tmp_pkgdir
+    dpkgjson = dest / "datapackage.json"
+    pkg = dwim_file(dpkgjson)
+    assert update(dest, title="foo bar", keywords="foo bar")
+    res = dwim_file(dpkgjson)
+    assert res.pop("title") == "foo bar"
+    assert res.pop("name") == "foo_bar"
+    assert res.pop("keywords") == ["foo", "bar"]
+    assert res["resources"] == pkg["resources"]
+
+
 def test_update_add(tmp_pkgdir):
     _, dest = tmp_pkgdir
     dpkgjson = dest / "datapackage.json"
@@ -216,6 +233,32 @@ def test_remove(tmp_pkgdir):
     assert msg and msg.count("yaml") == 1
 
 
+def test_remove_symlinked_dir(tmp_pkgdir, tmp_path):
+    _, dest = tmp_pkgdir
+    (dest / "inputs").rename(tmp_path / "inputs")
+    (dest / "inputs").symlink_to(tmp_path / "inputs", target_is_directory=True)
+    count = len(dwim_file(dest / "datapackage.json")["resources"])
+
+    remove(dest, dest / "inputs/energy_eff.csv", rm_from_disk=True)
+    pkgjson = dwim_file(dest / "datapackage.json")
+    assert len(pkgjson["resources"]) == count - 1
+    assert "inputs/energy_eff.csv" not in glom(pkgjson, ("resources", ["path"]))
+    assert not (tmp_path / "inputs/energy_eff.csv").exists()
+
+
+def test_table():
+    keys = ("id", "title")
+    rows = [{"id": "CC0-1.0", "title": "CC0"}, {"id": "MIT", "title": "MIT License"}]
+    expected = [
+        "id       title",
+        "-------  -----------",
+        "CC0-1.0  CC0",
+        "MIT      MIT License",
+    ]
+    assert _table(rows, keys).splitlines() == expected
+    assert _table([], keys) == ""
+
+
 def test_license_display(caplog):
     tokens = ("domain", "id", "maintainer", "Apache", "GPL", "CC")
     table = list_licenses()
@@ -272,3 +315,49 @@ def test_describe(tmp_pkgdir, caplog):
     with pytest.raises(SystemExit):
         describe(pkgdir)
     assert_log(caplog, f"{pkg_json}: not found", "ERROR")
+
+
+def test_report_skip_unchanged(tmp_path, mock_profiler):
+    reports = mock_profiler
+    (tmp_path / "data.csv").write_text("region,value\nNL,1\nBE,2\n")
+    fields = [{"name": "region", "type": "string"}, {"name": "value", "type": "number"}]
+    spec = {"name": "data", "path": "data.csv", "schema": {"fields": fields}}
+    res = Resource(spec, basepath=f"{tmp_path}")
+    report_dir = tmp_path / "reports"
+    report_dir.mkdir()
+
+    assert _report(res, title="foo", report_dir=report_dir)["path"] == Path("data.html")
+    _report(res, title="foo", report_dir=report_dir)
+    assert len(reports) == 1  # unchanged
+    shas = [f.name for f in report_dir.iterdir() if f.suffix == ".sha"]
+    assert shas == [".data.sha"]  # hidden, not published with the reports
+
+    res["description"] = "bar"  # metadata changed
+    _report(res, title="foo", report_dir=report_dir)
+    assert len(reports) == 2
+
+    (tmp_path / "data.csv").write_text("region,value\nNL,1\nBE,3\n")
+    _report(res, title="foo", report_dir=report_dir)
+    assert len(reports) == 3
+
+    _report(res, title="baz", report_dir=report_dir)
+    assert len(reports) == 4
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="stub needs fork"
+)
+def test_reports(tmp_path, mock_profiler):
+    fields = [{"name": "region", "type": "string"}, {"name": "value", "type": "number"}]
+    resources = []
+    for name in ("foo", "bar", "baz", "qux"):  # enough to start a process pool
+        (tmp_path / f"{name}.csv").write_text("region,value\nNL,1\nBE,2\n")
+        schema = {"fields": fields}
+        resources.append({"name": name, "path": f"{name}.csv", "schema": schema})
+    pkg = Package({"name": "pkg", "resources": resources}, basepath=f"{tmp_path}")
+
+    report_dir = tmp_path / "reports"
+    assert reports(pkg, f"{report_dir}")
+    assert (report_dir / "index.html").exists()
+    for name in ("foo", "bar", "baz", "qux"):
+        assert (report_dir / f"{name}.html").exists()
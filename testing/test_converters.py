@@ -1,8 +1,14 @@
+from frictionless import Resource
 from glom import Assign, glom, Iter, T
 import numpy as np
 import pandas as pd
 import pytest
+import xarray as xr
 
+from friendly_data.converters import _io_map
+from friendly_data.converters import _notna_df
+from friendly_data.converters import _read_csv_arrow
+from friendly_data.converters import _reader
 from friendly_data.converters import _source_type
 from friendly_data.converters import from_df
 from friendly_data.converters import from_dst
@@ -25,6 +31,73 @@ def test_source_type_heuristics():
         _source_type("/path/to/non-existent-file.ext")
 
 
+@pytest.mark.parametrize(
+    "fpath, index_col, dtype, parse_dates",
+    [
+        (
+            "testing/files/random/data/sample-ok-1.csv",
+            False,
+            {"QWE": "Int64", "RTY": "bool", "UIO": "string", "ASD": "float"},
+            ["time"],
+        ),
+        (
+            "testing/files/mini-ex/outputs/capacity_factor.csv",
+            ["technology", "region", "carrier", "timestep"],
+            {"capacity_factor": "float"},
+            ["timestep"],
+        ),
+    ],
+)
+def test_read_csv_arrow(fpath, index_col, dtype, parse_dates):
+    pytest.importorskip("pyarrow")
+    opts = {"index_col": index_col, "dtype": dtype, "parse_dates": parse_dates}
+    expected = pd.read_csv(fpath, **opts)
+    res = _read_csv_arrow(fpath, na_values=set(), skiprows=None, **opts)
+    pd.testing.assert_frame_equal(res, expected)
+
+
+def test_read_csv_arrow_dates_as_text(tmp_path):
+    pytest.importorskip("pyarrow")
+    fpath = tmp_path / "data.csv"
+    fpath.write_text(
+        "time,day,value\n2020-01-01 10:00,2020-01-01,1\n2020-01-01 11:00,,2\n"
+    )
+    opts = {"index_col": "time", "dtype": {"value": "float"}, "parse_dates": []}
+    expected = pd.read_csv(fpath, **opts)
+    res = _read_csv_arrow(fpath, na_values=None, skiprows=None, **opts)
+    pd.testing.assert_frame_equal(res, expected)
+    assert res.index[0] == "2020-01-01 10:00"
+
+
+@pytest.mark.parametrize(
+    "time", ["2020-01-01T00:00:00Z", "2020-01-01T00:00:00+02:00", "2020-01-01"]
+)
+def test_reader_dates_tz(tmp_path, time):
+    pytest.importorskip("pyarrow")
+    fpath = tmp_path / "data.csv"
+    fpath.write_text(f"time,value\n{time},1\n")
+    opts = {"index_col": False, "dtype": {"value": "float"}, "parse_dates": ["time"]}
+    expected = pd.read_csv(fpath, **opts)
+    res = _reader(fpath, na_values=None, skiprows=None, **opts)
+    pd.testing.assert_frame_equal(res, expected)
+    if expected["time"].dt.tz is not None:
+        with pytest.raises(ValueError, match="timezone aware"):
+            _read_csv_arrow(fpath, na_values=None, skiprows=None, **opts)
+
+
+@pytest.mark.parametrize("nitems", [0, 1, 20])
+def test_io_map(nitems):
+    assert _io_map(lambda i: i * 2, range(nitems)) == [i * 2 for i in range(nitems)]
+
+    def _raise(i):
+        if i == 3:
+            raise ValueError(f"{i}")
+        return i
+
+    with pytest.raises(ValueError, match="3"):
+        _io_map(_raise, range(20))
+
+
 @pytest.mark.skip(reason="not sure how to test schema parsing")
 def test_schema_parsing():
     pass
@@ -89,6 +162,34 @@ def test_pkg_to_df(rnd_pkg):
     assert to_df(resource, noexcept=True).empty  # suppress exceptions
 
 
+def test_pkg_to_df_usecols(rnd_pkg):
+    resource = rnd_pkg.resources[0]
+    df = to_df(resource, usecols=["QWE", "ASD"])  # "time" is a datetime column
+    assert list(df.columns) == ["QWE", "ASD"]
+
+    glom(resource, Assign("schema.primaryKey", ["time"]))
+    df = to_df(resource, usecols=["ASD"])  # index is read even if not requested
+    assert df.index.names == ["time"]
+    assert list(df.columns) == ["ASD"]
+
+
+@pytest.mark.parametrize("index", [None, "day", ["day", "region"]])
+def test_pkg_to_df_date_format(tmp_path, index):
+    (tmp_path / "data.csv").write_text(
+        "day,region,value\n01/02/2020,NL,1.5\n02/02/2020,BE,2\n01/02/2020,BE,3\n"
+    )
+    fields = [
+        {"name": "day", "type": "date", "format": "%d/%m/%Y"},
+        {"name": "region", "type": "string"},
+        {"name": "value", "type": "number"},
+    ]
+    schema = {"fields": fields, **({"primaryKey": index} if index else {})}
+    resource = Resource({"path": "data.csv", "schema": schema}, basepath=f"{tmp_path}")
+    df = to_df(resource).reset_index()
+    assert df["day"].dtype == np.dtype("datetime64[ns]")
+    assert df["day"].dt.month.unique().tolist() == [2]
+
+
 def test_pkg_to_df_skip_rows(pkg_meta):
     _, pkg, __ = pkg_from_index(pkg_meta, "testing/files/skip_test/index.yaml")
     df = to_df(pkg["resources"][0])
@@ -112,6 +213,28 @@ def test_resolve_aliases(pkg_w_alias):
             assert "flow_in" in df.columns
 
 
+def test_resolve_aliases_labels_only():
+    idx = pd.MultiIndex.from_tuples([("NL", 1), ("BE", 2)], names=["node", "year"])
+    df = pd.DataFrame({"energy_in": [1.0, 2.0]}, index=idx)
+    alias = {"node": "region", "energy_in": "flow_in"}
+    res = resolve_aliases(df, alias)
+    assert res.index.names == ["region", "year"]
+    assert list(res.columns) == ["flow_in"]
+    # original is unaltered
+    assert df.index.names == ["node", "year"]
+    assert list(df.columns) == ["energy_in"]
+
+    series = df["energy_in"].droplevel("year")  # single level index
+    assert resolve_aliases(series, alias).index.name == "region"
+    assert series.index.name == "node"
+
+    res.iloc[0, 0] = 99  # the data is copied
+    res["flow_in"] *= 2
+    assert df["energy_in"].tolist() == [1.0, 2.0]
+    res = resolve_aliases(df, alias, copy=False)
+    assert np.shares_memory(res["flow_in"].to_numpy(), df["energy_in"].to_numpy())
+
+
 def test_df_to_resource(tmp_path, pkg_w_alias):
     df = to_df(pkg_w_alias["resources"][1])
     res = from_df(df, basepath=tmp_path)
@@ -142,6 +265,26 @@ def test_df_to_resource(tmp_path, pkg_w_alias):
             assert res_alias == alias
 
 
+def test_df_to_resource_inferred_types(tmp_path):
+    df = pd.DataFrame(
+        {
+            "region": ["NL", "BE", "FR", "DE"],
+            "capacity": [1.0, 2.0, 3.0, 4.0],  # integral floats stay numbers
+            "count": [1, 2, 3, 4],
+            "note": ["a", "b", "c", "d"],
+        }
+    ).set_index("region")
+    res = from_df(df, basepath=tmp_path, datapath="data.csv")
+    types = {f["name"]: f["type"] for f in res["schema"]["fields"]}
+    assert types == {
+        "region": "string",
+        "capacity": "number",
+        "count": "integer",
+        "note": "string",
+    }
+    assert to_df(res)["capacity"].dtype == np.dtype(float)
+
+
 def test_xr_metadata(pkg_w_alias):
     # 1: alias, unit, 2: alias
     df1, df2 = [to_df(res) for res in pkg_w_alias.resources]
@@ -157,6 +300,16 @@ def test_xr_metadata(pkg_w_alias):
     assert set(attrs2) == {"unit"}
 
 
+@pytest.mark.parametrize("rows", [slice(None), slice(None, None, -1), [0, 3, 5]])
+def test_xr_metadata_aligned(rows):
+    idx = pd.MultiIndex.from_product([list("abc"), [1, 2]], names=["x", "y"])
+    df = pd.DataFrame({"v": np.arange(6.0)}, index=idx).iloc[rows]
+    df_res, coords, _ = xr_metadata(df)
+    expected = df.reindex(pd.MultiIndex.from_product(coords.values()))
+    pd.testing.assert_frame_equal(df_res, expected)
+    assert not np.shares_memory(df_res["v"].to_numpy(), df["v"].to_numpy())
+
+
 def test_xr_da(pkg_w_alias):
     # 1: alias, 2: alias, unit
     df1, df2 = [to_df(res) for res in pkg_w_alias.resources]
@@ -184,6 +337,18 @@ def test_xr_da(pkg_w_alias):
     assert (arr1.data == expected).all() and (arr2.data == expected).all()
 
 
+@pytest.mark.parametrize(
+    "values, dtype",
+    [([1, 2, 3, 4], "int64"), ([1, None, 3, 4], "float64")],
+)
+def test_xr_da_nullable(values, dtype):
+    idx = pd.MultiIndex.from_product([list("ab"), [1, 2]], names=["x", "y"])
+    df = pd.DataFrame({"v": pd.array(values, dtype="Int64")}, index=idx)
+    arr = xr_da(df, "v", coords=dict(zip(idx.names, idx.levels)))
+    assert arr.dtype == dtype and arr.shape == (2, 2)
+    assert arr.data.flags.c_contiguous
+
+
 def test_to_da(pkg_w_alias):
     # alias, unit
     res = pkg_w_alias.resources[1]  # "unit" is excluded from dims
@@ -214,6 +379,26 @@ def test_to_dst(pkg_w_alias):
     assert len(to_dst(res).data_vars) == 2
 
 
+@pytest.mark.parametrize("foo", ["2", "NA"])  # single block, and mixed dtypes
+def test_to_dst_columns(tmp_path, foo):
+    (tmp_path / "data.csv").write_text(
+        f"region,unit,value,foo\nNL,MW,1.5,1\nBE,MW,,{foo}\nDE,MW,3,3\n"
+    )
+    fields = [
+        {"name": "region", "type": "string"},
+        {"name": "unit", "type": "string"},
+        {"name": "value", "type": "number"},
+        {"name": "foo", "type": "number" if foo.isdigit() else "integer"},
+    ]
+    schema = {"fields": fields, "primaryKey": ["region", "unit"]}
+    resource = Resource({"path": "data.csv", "schema": schema}, basepath=f"{tmp_path}")
+    dst = to_dst(resource)
+    df, coords, attrs = xr_metadata(to_df(resource))
+    for col in df.columns:
+        assert dst[col].equals(xr_da(df, col, coords=coords, attrs=attrs))
+        assert dst[col].attrs == {"unit": "MW"}
+
+
 def test_to_mfdst(pkg_w_alias):
     dst = to_mfdst(pkg_w_alias.resources)
     assert len(dst.data_vars) == 2
@@ -223,3 +408,25 @@ def test_dst_to_pkg(tmp_path, pkg_w_alias):
     dst = to_mfdst(pkg_w_alias.resources)
     resources = from_dst(dst, basepath=tmp_path)
     assert all((tmp_path / res["path"]).exists() for res in resources)
+
+
+def test_dst_to_pkg_same_file(tmp_path):
+    da = xr.DataArray(np.arange(3.0), coords={"x": list("abc")}, dims="x")
+    dst = xr.Dataset({"a b": da, "a_b": da * 2})
+    with pytest.raises(ValueError, match="a_b.csv"):
+        from_dst(dst, basepath=tmp_path)
+    assert not list(tmp_path.iterdir())
+
+
+def test_notna_df():
+    data = np.arange(60, dtype=float).reshape(4, 3, 5)
+    data[data % 3 > 0] = np.nan  # sparse
+    coords = {"x": list("abcd"), "y": [1, 2, 3], "t": pd.date_range("2020", periods=5)}
+    da = xr.DataArray(data, coords=coords, dims=("x", "y", "t"), name="val")
+    for arr in (
+        da,
+        da.isel(y=0, t=0, drop=True),  # 1-D
+        da.assign_coords(x2=("x", [1, 2, 3, 4])),  # non-dimension coordinate
+    ):
+        expected = arr.to_dataframe().dropna()
+        pd.testing.assert_frame_equal(_notna_df(arr), expected)
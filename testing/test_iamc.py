@@ -1,3 +1,4 @@
+from copy import deepcopy
 from pathlib import Path
 from glom import glom, Match
 
@@ -91,6 +92,12 @@ def test_iamconv_match(iamconv):
     assert glom(res, Match((dict, pd.DataFrame)))
 
 
+def test_iamconv_match_records_unchanged(iamconv):
+    records = deepcopy(iamconv._records)
+    iamconv.to_df([fp for fp in iamconv.res_idx.get("path")])
+    assert iamconv._records == records
+
+
 def test_iamconv_iamcify(iamconv):
     df = (
         to_df(res_from_entry(iamconv.res_idx[0], iamconv.basepath))
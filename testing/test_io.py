@@ -1,5 +1,7 @@
 from itertools import chain
+import os
 from pathlib import Path
+import shutil
 import pytest
 import requests
 
@@ -12,20 +14,40 @@ from friendly_data.io import relpaths
 from friendly_data.metatools import ODLS
 
 
+@pytest.mark.parametrize("max_workers", [1, 4])
 @pytest.mark.parametrize("anchored", [True, False])
-def test_copy_files(tmp_path, anchored):
+def test_copy_files(tmp_path, anchored, max_workers):
     pkgdir = Path("testing/files/mini-ex")
     src = list(pkgdir.rglob("*.csv"))
     if anchored:
-        res = copy_files(src, tmp_path, pkgdir)
+        res = copy_files(src, tmp_path, pkgdir, max_workers=max_workers)
         assert len(list(tmp_path.rglob("*.csv"))) == len(res) == len(src)
         assert len(list(tmp_path.glob("*.csv"))) == 0  # no CSV in top-level dir
     else:
-        res = copy_files(src, tmp_path)  # paths not anchored
+        res = copy_files(src, tmp_path, max_workers=max_workers)  # not anchored
         assert len(list(tmp_path.glob("*.csv"))) == len(res) == len(src)
     assert all(map(lambda fp: fp.exists(), res))
 
 
+def test_copy_files_skip_unchanged(tmp_path, monkeypatch):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "foo.csv").write_text("a,b\n1,2\n")
+    dest = tmp_path / "dest"
+    res = copy_files([src / "foo.csv"], dest)
+    mtime = res[0].stat().st_mtime_ns
+
+    res[0].write_text("a,b\n1,2\n")  # touch: mtime differs from source
+    assert copy_files([src / "foo.csv"], dest) == res
+    assert res[0].stat().st_mtime_ns == mtime  # copied again
+
+    def _fail(*args):
+        raise AssertionError("unchanged file copied again")
+
+    monkeypatch.setattr(shutil, "copy2", _fail)
+    assert copy_files([src / "foo.csv"], dest) == res
+
+
 def test_relpaths():
     basepath = Path("testing/files/random")
     pattern = "data/*.csv"
@@ -67,6 +89,32 @@ def test_dwim_file_write(tmp_path, ext):
     assert fpath.exists()
 
 
+@pytest.mark.parametrize("ext", [".yaml", ".json"])
+def test_dwim_file_read_cached(tmp_path, ext):
+    fpath = tmp_path / f"conf{ext}"
+    dwim_file(fpath, {"foo": [1, 2]})
+    res = dwim_file(fpath)
+    res["foo"].append(3)  # modifying the result does not affect the cache
+    assert dwim_file(fpath) == {"foo": [1, 2]}
+
+    dwim_file(fpath, {"bar": 1})  # changed files are reparsed
+    assert dwim_file(fpath) == {"bar": 1}
+
+
+def test_dwim_file_read_cached_same_mtime(tmp_path):
+    fpath = tmp_path / "index.yaml"
+    fpath.write_text("- path: a.csv\n")
+    st = fpath.stat()
+    assert dwim_file(fpath) == [{"path": "a.csv"}]
+
+    # replace w/ same size & modification time, like `rsync -t` or `cp -p`
+    tmp = tmp_path / "index.tmp"
+    tmp.write_text("- path: b.csv\n")
+    os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    tmp.replace(fpath)
+    assert dwim_file(fpath) == [{"path": "b.csv"}]
+
+
 @pytest.mark.parametrize("http_cache", [ODLS], indirect=["http_cache"])
 def test_http_cache_file(http_cache):
     assert http_cache.cachedir.exists()
@@ -21,6 +21,12 @@ def test_registry(col, col_t, reg):
     assert isinstance(res, dict)
 
 
+def test_registry_cached_copy():
+    res = registry.get("region", "idxcols")
+    res["constraints"] = {"enum": ["foo"]}
+    assert registry.get("region", "idxcols") != res
+
+
 @pytest.mark.parametrize(
     "col, col_t, msg", [("notinreg", "cols", "notinreg: not in registry")]
 )